@@ -4,16 +4,18 @@ import json
 import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import fields
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from datetime import datetime
-import jsonpickle
-from requests.exceptions import ChunkedEncodingError
 from rich.progress import Progress, TransferSpeedColumn
 from rich.table import Table
 from rich.tree import Tree
-from urllib3.exceptions import IncompleteRead
+from urllib3.exceptions import IncompleteRead, ProtocolError
 import click
 from rich.console import Console
 
@@ -24,104 +26,306 @@ try:
 except ImportError:
     pass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from rich.traceback import install
 
 install(show_locals=True)
 
 SAVE_FILE = 'fetchtv_save_list.json'
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'fetchtv', 'server.json')
+CACHE_TTL = 24 * 60 * 60
 FETCHTV_PORT = 49152
 CONST_LOCK = '.lock'
 MAX_FILENAME = 255
 REQUEST_TIMEOUT = 5
 MAX_OCTET = 4398046510080
+MAX_PARALLEL_DOWNLOADS = 4
+MAX_PARALLEL_RANGES = 5
+RANGE_CHUNK_SIZE = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PROGRESS_INTERVAL = 0.25
 
 console = Console(highlight=False, log_path=False)
 
+# One keep-alive session for all media requests, everything talks to the same box.
+# The pool must cover every download thread fetching ranges at once, plus a spare
+# connection per download for its probes, or urllib3 discards connections instead
+# of keeping them alive.
+SESSION = requests.Session()
+SESSION.mount(
+    'http://',
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=MAX_PARALLEL_DOWNLOADS * (MAX_PARALLEL_RANGES + 1),
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
 
 class SavedFiles:
     """
     FetchTV recorded items that have already been saved
-    Serialised to and from JSON
+    Persisted as an append-only journal of JSON lines, one item per line
     """
 
+    __slots__ = ('files', 'path', 'ids')
+
     @staticmethod
     def load(path):
         """
-        Instantiate from JSON file, if it exists
+        Instantiate from the journal file, if it exists.
+        Legacy jsonpickle save lists are migrated on first load.
         """
+        inst = SavedFiles()
+        inst.path = path
+        legacy = False
+        entries = 0
         with open(path + os.path.sep + SAVE_FILE, 'a+') as read_file:
             read_file.seek(0)
-            content = read_file.read()
-            inst = jsonpickle.loads(content) if content else SavedFiles()
-            inst.path = path
-            return inst
+            for line in read_file:
+                line = line.strip()
+                if not line:
+                    continue
+                if entries == 0 and 'py/object' in line:
+                    # Legacy jsonpickle format: a single JSON object holding the whole dict
+                    inst.files = json.loads(line).get('_SavedFiles__files', {})
+                    legacy = True
+                    break
+                entry = json.loads(line)
+                inst.files[entry['id']] = entry['title']
+                entries += 1
+        if legacy or entries > len(inst.files):
+            inst.compact()
+        inst.ids = set(inst.files)
+        return inst
 
     def __init__(self):
-        self.__files = {}
+        self.files = {}
+        self.ids = set()
         self.path = ''
 
     def add_file(self, item):
-        self.__files[item.id] = item.title
-        # Serialise after each success
+        self.files[item.id] = item.title
+        self.ids.add(item.id)
+        # Append to the journal after each success, no full rewrite
+        with open(self.path + os.path.sep + SAVE_FILE, 'a') as write_file:
+            write_file.write(json.dumps({'id': item.id, 'title': item.title}) + '\n')
+
+    def compact(self):
+        """
+        Rewrite the journal with one line per unique item
+        """
         with open(self.path + os.path.sep + SAVE_FILE, 'w') as write_file:
-            write_file.write(jsonpickle.dumps(self))
+            for item_id, title in self.files.items():
+                write_file.write(json.dumps({'id': item_id, 'title': title}) + '\n')
 
     def contains(self, item):
-        return item.id in self.__files.keys()
+        return item.id in self.ids
+
+
+# Remove special characters and replace whitespace, in one translation pass
+FILENAME_TRANSLATIONS = str.maketrans({c: '' for c in '<>:"/\\|?*'} | {'\t': '_', ' ': '_'})
 
 
 def create_valid_filename(filename: str) -> str:
-    result = filename.strip()
-    # Remove special characters
-    for c in '<>:"/\\|?*':
-        result = result.replace(c, '')
-    # Remove whitespace
-    for c in '\t ':
-        result = result.replace(c, '_')
-    return result[:MAX_FILENAME]
+    return filename.strip().translate(FILENAME_TRANSLATIONS)[:MAX_FILENAME]
 
 
-def download_file(item: upnp.Item, filename: str, json_result: dict) -> bool:
+def download_stream(url: str, f, progress: Progress, task) -> None:
+    """
+    Download the whole url body over a single streamed connection.
+    Reads straight from the urllib3 response in big chunks, iter_content's
+    small default means thousands of Python-level iterations per GB.
+    """
+    with SESSION.get(url, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        accumulated = 0
+        last_update = time.monotonic()
+        while True:
+            chunk = r.raw.read(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+            # Batch the progress updates, each one crosses a lock in rich
+            accumulated += len(chunk)
+            now = time.monotonic()
+            if now - last_update > PROGRESS_INTERVAL:
+                progress.update(task, advance=accumulated)
+                accumulated = 0
+                last_update = now
+        progress.update(task, advance=accumulated)
+
+
+def download_ranges(url: str, f, total_length: int, progress: Progress, task) -> bool:
+    """
+    Download the url body as concurrent byte-range requests written to their
+    offsets in the output file. A single TCP stream rarely fills the pipe for
+    multi-GB recordings; parallel ranges do.
+    Returns False if the server ignores Range headers (200 instead of 206).
+    """
+    if total_length < RANGE_CHUNK_SIZE * 2:
+        return False
+    if not hasattr(os, 'pwrite'):
+        # No positional writes on this platform (Windows), stream instead
+        return False
+
+    first = SESSION.get(url, headers={'Range': f'bytes=0-{RANGE_CHUNK_SIZE - 1}'}, stream=True)
+    if first.status_code != 206:
+        first.close()
+        return False
+
+    f.truncate(total_length)
+    fd = f.fileno()
+    received = {}
+
+    def write_body(response, start: int) -> None:
+        offset = start
+        with response as r:
+            if r.status_code == 416:
+                # Range starts past the real end of file, the box overstated Content-Length
+                received[start] = 0
+                return
+            r.raise_for_status()
+            r.raw.decode_content = True
+            accumulated = 0
+            last_update = time.monotonic()
+            while True:
+                chunk = r.raw.read(DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+                # Batch the progress updates, each one crosses a lock in rich
+                accumulated += len(chunk)
+                now = time.monotonic()
+                if now - last_update > PROGRESS_INTERVAL:
+                    progress.update(task, advance=accumulated)
+                    accumulated = 0
+                    last_update = now
+            progress.update(task, advance=accumulated)
+        received[start] = offset - start
+
+    def fetch_range(start: int, end: int) -> None:
+        write_body(SESSION.get(url, headers={'Range': f'bytes={start}-{end}'}, stream=True), start)
+
+    write_body(first, 0)
+    ranges = [
+        (start, min(start + RANGE_CHUNK_SIZE, total_length) - 1)
+        for start in range(RANGE_CHUNK_SIZE, total_length, RANGE_CHUNK_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_RANGES) as executor:
+        futures = [executor.submit(fetch_range, start, end) for start, end in ranges]
+        # Wait for every range before raising, so no failure is discarded
+        errors = [future.exception() for future in futures]
+    for error in errors:
+        if error:
+            raise error
+
+    # The box can overstate Content-Length; trim the pre-sized file back to the
+    # data actually received rather than keeping trailing zero padding
+    end_of_data = 0
+    for start, end in [(0, RANGE_CHUNK_SIZE - 1)] + ranges:
+        end_of_data = start + received[start]
+        if received[start] < end - start + 1:
+            # Short anywhere but the tail means a hole in the file
+            if any(received[later] for later, _ in ranges if later > start):
+                raise ProtocolError(
+                    f'Byte range at offset {start} returned {received[start]} of {end - start + 1} bytes'
+                )
+            break
+    if end_of_data < total_length:
+        os.ftruncate(fd, end_of_data)
+    return True
+
+
+def open_download_target(filename: str) -> tuple:
+    """
+    Open the file a download is written to, returning it and a finaliser that
+    puts it in place under its real name.
+    On Linux the file is anonymous (O_TMPFILE) and linked into place only on
+    success, so an interrupted download leaves nothing behind. Elsewhere (or
+    on filesystems without O_TMPFILE) the old .lock sentinel plus rename is
+    used.
+    """
+    if hasattr(os, 'O_TMPFILE'):
+        fd = None
+        try:
+            fd = os.open(os.path.dirname(filename), os.O_TMPFILE | os.O_WRONLY, 0o644)
+            # Some filesystems accept O_TMPFILE but refuse to link the result, so check now
+            probe = f'{filename}.{os.getpid()}.probe'
+            os.link(f'/proc/self/fd/{fd}', probe)
+            os.unlink(probe)
+        except OSError:
+            if fd is not None:
+                os.close(fd)
+        else:
+            f = os.fdopen(fd, 'wb', buffering=DOWNLOAD_CHUNK_SIZE)
+
+            def finalise():
+                f.flush()
+                if os.path.exists(filename):
+                    os.unlink(filename)
+                os.link(f'/proc/self/fd/{fd}', filename)
+
+            return f, finalise
+
+    f = open(filename + CONST_LOCK, 'xb', buffering=DOWNLOAD_CHUNK_SIZE)
+
+    def finalise():
+        f.close()
+        os.rename(filename + CONST_LOCK, filename)
+
+    return f, finalise
+
+
+def download_file(item: upnp.Item, filename: str, json_result: dict, progress: Progress) -> bool:
     """
     Download the url contents to a file
     """
-    progress = Progress(
-        *Progress.get_default_columns(),
-        TransferSpeedColumn(),
-        console=console,
-    )
     console.log(f'Writing: [{item.title}] to [{filename}]', markup=False)
-    with requests.get(item.url, stream=True) as r:
-        r.raise_for_status()
-        total_length = int(r.headers.get('content-length'))
-        if total_length == MAX_OCTET:
-            msg = "Skipping item it's currently recording"
-            print_warning(msg)
-            json_result['warning'] = msg
-            return False
+    # Peek at the size first so we don't open a media stream for an in-progress recording
+    total_length = get_content_length(item.url)
+    if total_length == MAX_OCTET:
+        msg = "Skipping item it's currently recording"
+        print_warning(msg)
+        json_result['warning'] = msg
+        return False
+
+    try:
+        f, finalise = open_download_target(filename)
+    except FileExistsError:
+        msg = 'Already writing (lock file exists) skipping'
+        print_warning(msg)
+        json_result['warning'] = msg
+        return False
 
+    try:
         try:
-            with open(filename + CONST_LOCK, 'xb') as f:
-                with progress:
-                    task = progress.add_task('Downloading', total=total_length)
-                    progress.start_task(task)
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:  # filter out keep-alive new chunks
-                            f.write(chunk)
-                            progress.update(task, advance=len(chunk))
-
-        except FileExistsError:
-            msg = 'Already writing (lock file exists) skipping'
-            print_warning(msg)
-            json_result['warning'] = msg
-            return False
-        except ChunkedEncodingError as err:
-            if err.args:
-                try:
-                    if isinstance(err.args[0].args[1], IncompleteRead):
-                        msg = 'Final read was short; FetchTV sets the wrong Content-Length header. File should be fine'
-                except IndexError:
-                    msg = f'Chunked encoding error occurred. Content length was {total_length}. Error was: {err}'
+            task = progress.add_task(item.title, total=total_length)
+            progress.start_task(task)
+            try:
+                ranged = download_ranges(item.url, f, total_length, progress, task)
+            except (ProtocolError, requests.RequestException) as err:
+                # A failed range means missing bytes at a known offset, never keep the file
+                msg = f'Byte-range download failed, discarding the incomplete file. Error was: {err}'
+                print_error(msg)
+                json_result['error'] = msg
+                return False
+            if not ranged:
+                download_stream(item.url, f, progress, task)
+
+        except ProtocolError as err:
+            # Only the single-stream path can shrug off a short read: the bytes
+            # received so far are contiguous, the box just overstated the length
+            if any(isinstance(arg, IncompleteRead) for arg in err.args):
+                msg = 'Final read was short; FetchTV sets the wrong Content-Length header. File should be fine'
+            else:
+                msg = f'Connection error occurred. Content length was {total_length}. Error was: {err}'
 
             print_warning(msg)
             json_result['warning'] = msg
@@ -131,8 +335,10 @@ def download_file(item: upnp.Item, filename: str, json_result: dict) -> bool:
             json_result['error'] = msg
             return False
 
-        os.rename(filename + CONST_LOCK, filename)
-        return True
+        finalise()
+    finally:
+        f.close()
+    return True
 
 
 def get_fetch_recordings(location: upnp.Location, folder: tuple[str], exclude: tuple[str], title: tuple[str], shows: bool,
@@ -141,94 +347,135 @@ def get_fetch_recordings(location: upnp.Location, folder: tuple[str], exclude: t
     Return all FetchTV recordings, or only for a particular folder if specified
     """
     api_service = upnp.get_services(location)
-    base_folders = upnp.find_directories(api_service)
+    base_folders = upnp.find_directories(api_service, with_items=False)
     recording = [folder for folder in base_folders if folder.title == 'Recordings']
     if len(recording) == 0:
         return []
-    recordings = upnp.find_directories(api_service, recording[0].id)
-    return filter_recording_items(folder, exclude, title, shows, is_recording, recordings)
-
-
-def has_include_folder(recording: upnp.Folder, folder: tuple[str]) -> bool:
-    return not (
-        folder
-        and not next(
-            (
-                include_folder
-                for include_folder in folder
-                if recording.title.lower().find(include_folder.strip().lower()) != -1
-            ),
-            False,
-        )
-    )
-
-
-def has_exclude_folder(recording: upnp.Folder, exclude: tuple[str]) -> tuple:
-    return exclude and next(
-        (
-            exclude_folder
-            for exclude_folder in exclude
-            if recording.title.lower().find(exclude_folder.strip().lower()) != -1
-        ),
-        False,
-    )
-
-
-def has_title_match(item, title):
-    return not (
-        title
-        and not next(
-            (include_title for include_title in title if item.title.lower().find(include_title.strip().lower()) != -1),
-            False,
-        )
-    )
+    recordings = upnp.find_directories(api_service, recording[0].id, with_items=False)
+
+    # Apply the folder filters before browsing for items, each folder's items cost a UPnP Browse request
+    include = lower_filters(folder)
+    excluded = lower_filters(exclude)
+    wanted = []
+    for recording_folder in recordings:
+        folder_title = recording_folder.title.lower()
+        if (include and not any(sub in folder_title for sub in include)) or any(
+            sub in folder_title for sub in excluded
+        ):
+            continue
+        wanted.append(recording_folder)
+
+    if not shows:
+        for recording_folder in wanted:
+            recording_folder.add_items(
+                upnp.find_items(api_service['cd_ctr'], api_service['cd_service'], recording_folder.id)
+            )
+    return filter_recording_items(title, shows, is_recording, wanted)
+
+
+def lower_filters(filters: tuple[str]) -> tuple[str, ...]:
+    """
+    Normalise user-supplied filter substrings once, so the per-item
+    comparisons are plain C-level substring scans.
+    """
+    return tuple(substring.strip().lower() for substring in filters) if filters else ()
+
+
+def get_content_length(url: str) -> int:
+    """
+    Return the Content-Length of a URL using a HEAD request, avoiding a full media stream.
+    Falls back to a streamed GET for servers that don't implement HEAD.
+    """
+    r = SESSION.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+    if r.status_code in (405, 501):
+        # Server doesn't support HEAD, peek at the stream instead
+        with SESSION.get(url, stream=True) as r:
+            r.raise_for_status()
+            return int(r.headers.get('content-length', 0))
+    r.raise_for_status()
+    return int(r.headers.get('content-length', 0))
 
 
 def currently_recording(item: upnp.Item) -> bool:
-    with requests.get(item.url, stream=True) as r:
-        r.raise_for_status()
-        total_length = int(r.headers.get('content-length'))
-        return total_length == MAX_OCTET
+    return get_content_length(item.url) == MAX_OCTET
 
 
-def filter_recording_items(folder: tuple[str], exclude: tuple[str], title: tuple[str], shows: bool, is_recording: bool,
+def filter_recording_items(title: tuple[str], shows: bool, is_recording: bool,
                            recordings: list[upnp.Folder]) -> list[dict]:
     """
-    Process the returned FetchTV recordings and filter the results as per the provided options.
+    Process the pre-filtered FetchTV recording folders and filter their items as per the provided options.
     """
+    wanted_titles = lower_filters(title)
     results = []
     for recording in recordings:
         result = {'title': recording.title, 'id': recording.id, 'items': []}
-        # Skip not matching folders
-        if not has_include_folder(recording, folder) or has_exclude_folder(recording, exclude):
-            continue
 
         # Process recorded items
         if not shows:  # Include items
             for item in recording.items:
                 # Skip not matching titles
-                if not has_title_match(item, title):
+                item_title = item.title.lower()
+                if wanted_titles and not any(sub in item_title for sub in wanted_titles):
                     continue
 
-                # Only include recording item if requested
-                if not is_recording or currently_recording(item):
-                    result['items'].append(item)
+                result['items'].append(item)
 
         results.append(result)
-        if is_recording:
-            # Only return folders with a recording item
-            results = [result for result in results if len(result['items']) > 0]
+
+    if is_recording:
+        # Probe all candidate items in parallel, the checks are independent HTTP round-trips
+        candidates = [(result, item) for result in results for item in result['items']]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            flags = list(executor.map(currently_recording, (item for _, item in candidates)))
+        for result in results:
+            result['items'] = []
+        for (result, item), recording_now in zip(candidates, flags):
+            if recording_now:
+                result['items'].append(item)
+        # Only return folders with a recording item
+        results = [result for result in results if len(result['items']) > 0]
     return results
 
 
-def discover_fetch(ip: str = False, port: int = FETCHTV_PORT) -> upnp.Location | None:
+def read_cached_location() -> str | None:
+    """
+    Return the previously discovered server URL if the cache is fresh and the box still answers.
+    """
+    try:
+        with open(CACHE_FILE) as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    url = cache.get('url')
+    if not url or time.time() - cache.get('ts', 0) > CACHE_TTL:
+        return None
+    try:
+        SESSION.head(url, timeout=2).raise_for_status()
+    except requests.RequestException:
+        return None
+    return url
+
+
+def write_cached_location(url: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w') as cache_file:
+            json.dump({'url': url, 'ts': time.time()}, cache_file)
+    except OSError:
+        pass
+
+
+def discover_fetch(ip: str = False, port: int = FETCHTV_PORT, no_cache: bool = False) -> upnp.Location | None:
     console.print('Starting discovery')
     try:
-        location_urls = (
-            upnp.ssdp_discovery(st='urn:schemas-upnp-org:device:MediaServer:1')
-            if not ip
-            else [f'http://{ip}:{port}/MediaServer.xml']
-        )
+        if ip:
+            location_urls = [f'http://{ip}:{port}/MediaServer.xml']
+        else:
+            # SSDP multicast blocks for seconds, reuse the last discovered URL while it's fresh
+            cached_url = None if no_cache else read_cached_location()
+            location_urls = (
+                [cached_url] if cached_url else upnp.ssdp_discovery(st='urn:schemas-upnp-org:device:MediaServer:1')
+            )
         locations = upnp.parse_locations(location_urls)
         # Find fetch
         result = [location for location in locations if location.manufacturerURL == 'http://www.fetch.com/']
@@ -240,24 +487,31 @@ def discover_fetch(ip: str = False, port: int = FETCHTV_PORT) -> upnp.Location |
         print_error(err)
         return None
 
+    if not ip:
+        write_cached_location(result[0].url)
     return result[0]
 
 
-def save_recordings(recordings: list[dict], save_path: str, overwrite: bool) -> list[dict]:
+def save_recordings(recordings: list[dict], save_path: str, overwrite: bool, sync: bool = False) -> list[dict]:
     """
     Save all recordings for the specified folder (if not already saved)
     """
     some_to_record = False
     path = save_path
     saved_files = SavedFiles.load(path)
+    already_saved = saved_files.ids
+    save_lock = threading.Lock()
     json_result = []
+    pending = []
+    created_directories = set()
     for show in recordings:
         for item in show['items']:
-            if overwrite or not saved_files.contains(item):
+            if overwrite or item.id not in already_saved:
                 some_to_record = True
                 directory = path + os.path.sep + create_valid_filename(show['title'])
-                if not os.path.exists(directory):
-                    os.makedirs(directory)
+                if directory not in created_directories:
+                    os.makedirs(directory, exist_ok=True)
+                    created_directories.add(directory)
                 file_path = directory + os.path.sep + create_valid_filename(item.title) + '.mpeg'
 
                 result = {'item': create_item(item), 'recorded': False}
@@ -270,9 +524,41 @@ def save_recordings(recordings: list[dict], save_path: str, overwrite: bool) ->
                     result['warning'] = msg
                     continue
 
-                if download_file(item, file_path, result):
+                # Already on disk at the full size (e.g. save list was deleted), no need to transfer
+                if (
+                    not overwrite
+                    and os.path.isfile(file_path)
+                    and os.path.getsize(file_path) == get_content_length(item.url)
+                ):
+                    print_item('Already on disk with matching size, skipping: [%s]' % item.title)
                     result['recorded'] = True
                     saved_files.add_file(item)
+                    continue
+
+                pending.append((item, file_path, result))
+
+    def save_one(item: upnp.Item, file_path: str, result: dict, progress: Progress) -> None:
+        if download_file(item, file_path, result, progress):
+            result['recorded'] = True
+            with save_lock:
+                saved_files.add_file(item)
+
+    if pending:
+        progress = Progress(
+            *Progress.get_default_columns(),
+            TransferSpeedColumn(),
+            console=console,
+        )
+        with progress:
+            if sync or len(pending) == 1:
+                for item, file_path, result in pending:
+                    save_one(item, file_path, result, progress)
+            else:
+                with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as executor:
+                    futures = [executor.submit(save_one, *args, progress) for args in pending]
+                    for future in futures:
+                        future.result()
+
     if not some_to_record:
         print_item('There is nothing new to record')
     return json_result
@@ -294,8 +580,11 @@ def print_heading(param: str) -> None:
     console.rule(title=param)
 
 
+EPISODE_RE = re.compile(r'^S\d+ E\d+')
+
+
 def create_item(item: upnp.Item) -> dict:
-    item_type = 'episode' if re.match('^S\\d+ E\\d+', item.title) else 'movie'
+    item_type = 'episode' if EPISODE_RE.match(item.title) else 'movie'
     return {
         'id': item.id,
         'title': item.title,
@@ -341,12 +630,18 @@ def print_recordings(recordings: list[dict], output_json: bool, show_table: bool
                     title.add(recording_table)
         console.print(tree)
     else:
-        output = []
-        for recording in recordings:
-            items = []
-            output.append({'id': recording['id'], 'title': recording['title'], 'items': items})
-            for item in recording['items']:
-                items.append(create_item(item))
+        output = [
+            {
+                'id': recording['id'],
+                'title': recording['title'],
+                'items': [create_item(item) for item in recording['items']],
+            }
+            for recording in recordings
+        ]
+        if orjson is not None:
+            encoded = orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
+            console.print(encoded, markup=False)
+            return encoded
         console.print_json(data=output)
         return json.dumps(output)
 
@@ -367,6 +662,8 @@ def print_recordings(recordings: list[dict], output_json: bool, show_table: bool
 @click.option(
     '--title', default=None, multiple=True, help='Only return recordings where the item contains the specified text'
 )
+@click.option('--no-cache', is_flag=True, help="Don't reuse the cached discovery result")
+@click.option('--sync', is_flag=True, help='Download recordings one at a time instead of in parallel')
 @click.option('--json', is_flag=True, help='Output show/recording/save results in JSON')
 @click.option('--debug', is_flag=True, help='Enable debug mode')
 @click.option('--table/--no-table', 'show_table', is_flag=True, default=True, help='Show recordings in a table')
@@ -382,6 +679,8 @@ def main(
     folder: tuple[str],
     exclude: tuple[str],
     title: tuple[str],
+    no_cache: bool,
+    sync: bool,
     json: bool,
     debug: bool,
     show_table: bool,
@@ -399,7 +698,7 @@ def main(
 
     print_heading(f'Started: {datetime.now():%Y-%m-%d %H:%M:%S}')
     with console.status('Discover Fetch UPnP location...'):
-        fetch_server = discover_fetch(ip=ip, port=port)
+        fetch_server = discover_fetch(ip=ip, port=port, no_cache=no_cache)
 
     if not fetch_server:
         return
@@ -424,7 +723,7 @@ def main(
         else:
             # with console.status('Saving recordings'):
             print_heading('Saving recordings')
-            json_result = save_recordings(fetch_recordings, save, overwrite)
+            json_result = save_recordings(fetch_recordings, save, overwrite, sync)
             if json:
                 console.print_json(data=json_result)
     print_heading(f'Done: {datetime.now():%Y-%m-%d %H:%M:%S}')
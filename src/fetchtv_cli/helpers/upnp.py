@@ -342,13 +342,15 @@ def get_services(location: Location) -> dict:
     return result
 
 
-def find_directories(api_service: dict, object_id: str = '0') -> list[Folder]:
+def find_directories(api_service: dict, object_id: str = '0', with_items: bool = True) -> list[Folder]:
     """
     Send a 'Browse' request for the top level directory. We will print out the
     top level containers that we observer. I've limited the count to 10.
 
     @param p_url the url to send the SOAPAction to
     @param p_service the service in charge of this control URI
+    @param with_items also browse each container for its items; pass False to
+           skip the per-folder Browse request when only the folders are needed
     """
     p_url = api_service['cd_ctr']
     p_service = api_service['cd_service']
@@ -385,7 +387,8 @@ def find_directories(api_service: dict, object_id: str = '0') -> list[Folder]:
         if container.find('./{urn:schemas-upnp-org:metadata-1-0/upnp/}class').text.find('object.container') > -1:
             folder = Folder(container)
             result.append(folder)
-            folder.add_items(find_items(p_url, p_service, container.attrib['id']))
+            if with_items:
+                folder.add_items(find_items(p_url, p_service, container.attrib['id']))
     return result
 
 
@@ -1,5 +1,8 @@
 import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from click.testing import CliRunner
 
@@ -57,6 +60,10 @@ def mock_get(p_url, timeout=0, stream=False):
     return result
 
 
+def mock_head(p_url, timeout=0, allow_redirects=True):
+    return mock_get(p_url, timeout=timeout)
+
+
 def mock_get_recording(p_url, timeout=0, stream=False):
     result = Mock()
     result.__enter__ = Mock(return_value=result)
@@ -150,6 +157,8 @@ class TestOptions:
 
 @patch('requests.get', mock_get)
 @patch('requests.post', mock_post)
+@patch.object(fetchtv.SESSION, 'get', mock_get)
+@patch.object(fetchtv.SESSION, 'head', mock_head)
 class TestGetFetchRecordings:
 
     def test_get_shows(self):
@@ -249,6 +258,8 @@ class TestGetFetchRecordings:
 
 @patch('requests.get', mock_get)
 @patch('requests.post', mock_post)
+@patch.object(fetchtv.SESSION, 'get', mock_get)
+@patch.object(fetchtv.SESSION, 'head', mock_head)
 class TestSaveRecordings:
 
     def test_already_saving_recording(self):
@@ -273,7 +284,139 @@ class TestSaveRecordings:
             os.rmdir(temp_dir + os.path.sep + show_folder)
 
 
-@patch('requests.get', mock_get)
+class TestSavedFiles:
+
+    @staticmethod
+    def make_item(item_id, title):
+        item = Mock()
+        item.id = item_id
+        item.title = title
+        return item
+
+    def test_journal_roundtrip(self, tmp_path):
+        saved_files = fetchtv.SavedFiles.load(str(tmp_path))
+        one = self.make_item('901', 'S1 E1')
+        two = self.make_item('902', 'S1 E2')
+        saved_files.add_file(one)
+        saved_files.add_file(two)
+
+        reloaded = fetchtv.SavedFiles.load(str(tmp_path))
+        assert reloaded.contains(one)
+        assert reloaded.contains(two)
+        assert not reloaded.contains(self.make_item('903', 'S1 E3'))
+
+    def test_compacts_duplicate_entries(self, tmp_path):
+        entry = json.dumps({'id': '901', 'title': 'S1 E1'})
+        with open(str(tmp_path / fetchtv.SAVE_FILE), 'w') as save_file:
+            save_file.write(entry + '\n' + entry + '\n')
+
+        saved_files = fetchtv.SavedFiles.load(str(tmp_path))
+        assert saved_files.contains(self.make_item('901', 'S1 E1'))
+        with open(str(tmp_path / fetchtv.SAVE_FILE)) as save_file:
+            assert len(save_file.readlines()) == 1
+
+    def test_migrates_legacy_jsonpickle_file(self, tmp_path):
+        legacy = {
+            'py/object': 'fetchtv_cli.fetchtv_cli.SavedFiles',
+            '_SavedFiles__files': {'901': 'S1 E1', '902': 'S1 E2'},
+            'path': str(tmp_path),
+        }
+        with open(str(tmp_path / fetchtv.SAVE_FILE), 'w') as save_file:
+            save_file.write(json.dumps(legacy))
+
+        saved_files = fetchtv.SavedFiles.load(str(tmp_path))
+        assert saved_files.contains(self.make_item('901', 'S1 E1'))
+        assert saved_files.contains(self.make_item('902', 'S1 E2'))
+        # The legacy file is rewritten in place as a journal
+        with open(str(tmp_path / fetchtv.SAVE_FILE)) as save_file:
+            lines = [json.loads(line) for line in save_file]
+        assert lines == [{'id': '901', 'title': 'S1 E1'}, {'id': '902', 'title': 'S1 E2'}]
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves `data` with byte-range support, optionally ignoring Range headers
+    """
+
+    data = b''
+    ignore_ranges = False
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.ignore_ranges or 'Range' not in self.headers:
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(self.data)))
+            self.end_headers()
+            self.wfile.write(self.data)
+            return
+        start, end = (int(value) for value in self.headers['Range'].split('=')[1].split('-'))
+        if start >= len(self.data):
+            self.send_response(416)
+            self.end_headers()
+            return
+        body = self.data[start:min(end + 1, len(self.data))]
+        self.send_response(206)
+        self.send_header('Content-Range', f'bytes {start}-{start + len(body) - 1}/{len(self.data)}')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # The client closing a streamed response early isn't a test failure
+        pass
+
+
+class TestDownloadRanges:
+    CHUNK = 64 * 1024
+
+    @classmethod
+    def setup_class(cls):
+        cls.server = QuietHTTPServer(('127.0.0.1', 0), RangeRequestHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_address[1]}/recording'
+
+    @classmethod
+    def teardown_class(cls):
+        cls.server.shutdown()
+
+    def download(self, tmp_path, total_length):
+        progress = fetchtv.Progress(console=fetchtv.console)
+        task = progress.add_task('test', total=total_length)
+        target = tmp_path / 'out.mpeg'
+        with patch.object(fetchtv, 'RANGE_CHUNK_SIZE', self.CHUNK):
+            with open(target, 'wb') as f:
+                ranged = fetchtv.download_ranges(self.url, f, total_length, progress, task)
+        return ranged, target.read_bytes()
+
+    def test_exact_length(self, tmp_path):
+        RangeRequestHandler.data = os.urandom(self.CHUNK * 3 + 123)
+        RangeRequestHandler.ignore_ranges = False
+        ranged, saved = self.download(tmp_path, len(RangeRequestHandler.data))
+        assert ranged
+        assert saved == RangeRequestHandler.data
+
+    def test_overstated_length_is_trimmed(self, tmp_path):
+        # FetchTV can overstate Content-Length; the file must not keep zero padding
+        RangeRequestHandler.data = os.urandom(self.CHUNK * 3)
+        RangeRequestHandler.ignore_ranges = False
+        ranged, saved = self.download(tmp_path, len(RangeRequestHandler.data) + self.CHUNK * 2 + 99)
+        assert ranged
+        assert saved == RangeRequestHandler.data
+
+    def test_server_without_range_support_falls_back(self, tmp_path):
+        RangeRequestHandler.data = os.urandom(self.CHUNK * 3)
+        RangeRequestHandler.ignore_ranges = True
+        ranged, saved = self.download(tmp_path, len(RangeRequestHandler.data))
+        assert not ranged
+        assert saved == b''
+
+
+@patch.object(fetchtv.SESSION, 'get', mock_get)
+@patch.object(fetchtv.SESSION, 'head', mock_head)
 class TestDownloadFile:
 
     def test_save_item(self, tmp_path):